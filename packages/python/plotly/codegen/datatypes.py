@@ -444,8 +444,8 @@ def add_constructor_params(buffer, subtype_nodes, prepend_extras=(), append_extr
 
     Parameters
     ----------
-    buffer : StringIO
-        Buffer to write to
+    buffer : StringIO or PartsWriter
+        Buffer to write to. Any object with a write method is accepted
     subtype_nodes : list of PlotlyNode
         List of datatype nodes to be written as constructor params
     prepend_extras : list[str]
@@ -492,8 +492,8 @@ def add_docstring(
 
     Parameters
     ----------
-    buffer : StringIO
-        Buffer to write to
+    buffer : StringIO or PartsWriter
+        Buffer to write to. Any object with a write method is accepted
     node : PlotlyNode
         Compound datatype plotly node for which to write docstring
     header :
@@ -1,4 +1,10 @@
-from io import StringIO
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections import namedtuple
+from functools import lru_cache
 from os import path as opath
 
 from _plotly_utils.basevalidators import (
@@ -15,77 +21,67 @@ from codegen.utils import PlotlyNode, write_source_py
 
 import inflect
 
+# Docstring constants
+# -------------------
+# These are identical for every trace type and subplot node, so they are
+# built once here rather than on every iteration of build_figure_py
+ROW_DOC = (
+    "row : int or None (default)",
+    "Subplot row index (starting from 1) for the trace to be "
+    "added. Only valid if figure was created using "
+    "`plotly.tools.make_subplots`",
+)
 
-def build_figure_py(
-    trace_node,
-    base_package,
-    base_classname,
-    fig_classname,
-    data_validator,
-    layout_validator,
-    frame_validator,
-    subplot_nodes,
-):
-    """
-
-    Parameters
-    ----------
-    trace_node : PlotlyNode
-        Root trace node (the node that is the parent of all of the
-        individual trace nodes like bar, scatter, etc.)
-    base_package : str
-        Package that the figure's superclass resides in
-    base_classname : str
-        Name of the figure's superclass
-    fig_classname : str
-        Name of the Figure class to be generated
-    data_validator : BaseDataValidator
-        DataValidator instance
-    layout_validator : CompoundValidator
-        LayoutValidator instance
-    frame_validator : CompoundArrayValidator
-        FrameValidator instance
-    subplot_nodes: list of str
-        List of names of all of the layout subplot properties
-    Returns
-    -------
-    str
-        Source code for figure class definition
-    """
-
-    # Initialize source code buffer
-    # -----------------------------
-    buffer = StringIO()
+COL_DOC = (
+    "col : int or None (default)",
+    "Subplot col index (starting from 1) for the trace to be "
+    "added. Only valid if figure was created using "
+    "`plotly.tools.make_subplots`",
+)
 
-    # Get list of trace type nodes
-    # ----------------------------
-    trace_nodes = trace_node.child_compound_datatypes
+SECONDARY_Y_DOC = (
+    "secondary_y: boolean or None (default None)",
+    """\
+            If True, associate this trace with the secondary y-axis of the
+            subplot at the specified row and col. Only valid if all of the
+            following conditions are satisfied:
+              * The figure was created using `plotly.subplots.make_subplots`.
+              * The row and col arguments are not None
+              * The subplot at the specified row and col has type xy
+                (which is the default) and secondary_y True.  These
+                properties are specified in the specs argument to
+                make_subplots. See the make_subplots docstring for more info.\
+""",
+)
 
-    # Write imports
-    # -------------
-    # ### Import base class ###
-    buffer.write(f"from plotly.{base_package} import {base_classname}\n")
+DOC_EXTRAS = (ROW_DOC, COL_DOC)
+DOC_EXTRAS_WITH_SECONDARY_Y = DOC_EXTRAS + (SECONDARY_Y_DOC,)
 
-    # ### Import trace graph_obj classes ###
-    trace_types_csv = ", ".join(n.name_datatype_class for n in trace_nodes)
-    buffer.write(f"from plotly.graph_objs import ({trace_types_csv})\n")
+SECONDARY_Y_SELECT_DOCSTRING = """
+        secondary_y: boolean or None (default None)
+            * If True, only select yaxis objects associated with the secondary
+              y-axis of the subplot.
+            * If False, only select yaxis objects associated with the primary
+              y-axis of the subplot.
+            * If None (the default), do not filter yaxis objects based on
+              a secondary y-axis condition. 
+            
+            To select yaxis objects by secondary y-axis, the Figure must
+            have been created using plotly.subplots.make_subplots. See
+            the docstring for the specs argument to make_subplots for more
+            info on creating subplots with secondary y-axes."""
 
-    # Write class definition
-    # ----------------------
-    buffer.write(
-        f"""
+# Figure class templates
+# ----------------------
+# Imports, class definition, and constructor of a figure class. Rendered
+# with str.format once per figure class.
+FIGURE_HEADER_TEMPLATE = """\
+from plotly.{base_package} import {base_classname}
+from plotly.graph_objs import ({trace_types_csv})
 
-class {fig_classname}({base_classname}):\n"""
-    )
 
-    # ### Constructor ###
-    # Build constructor description strings
-    data_description = reindent_validator_description(data_validator, 8)
-    layout_description = reindent_validator_description(layout_validator, 8)
-    frames_description = reindent_validator_description(frame_validator, 8)
+class {fig_classname}({base_classname}):
 
-    buffer.write(
-        f"""
     def __init__(self, data=None, layout=None,
                  frames=None, skip_invalid=False, **kwargs):
         \"\"\"
@@ -117,133 +113,11 @@ class {fig_classname}({base_classname}):\n"""
                                               frames, skip_invalid,
                                               **kwargs)
     """
-    )
-
-    # ### add_trace methods for each trace type ###
-    for trace_node in trace_nodes:
-
-        include_secondary_y = bool(
-            [d for d in trace_node.child_datatypes if d.name_property == "yaxis"]
-        )
-
-        # #### Function signature ####
-        buffer.write(
-            f"""
-    def add_{trace_node.plotly_name}(self"""
-        )
 
-        # #### Function params####
-        param_extras = ["row", "col"]
-        if include_secondary_y:
-            param_extras.append("secondary_y")
-        add_constructor_params(
-            buffer, trace_node.child_datatypes, append_extras=param_extras
-        )
-
-        # #### Docstring ####
-        header = f"Add a new {trace_node.name_datatype_class} trace"
-
-        doc_extras = [
-            (
-                "row : int or None (default)",
-                "Subplot row index (starting from 1) for the trace to be "
-                "added. Only valid if figure was created using "
-                "`plotly.tools.make_subplots`",
-            ),
-            (
-                "col : int or None (default)",
-                "Subplot col index (starting from 1) for the trace to be "
-                "added. Only valid if figure was created using "
-                "`plotly.tools.make_subplots`",
-            ),
-        ]
-
-        if include_secondary_y:
-            doc_extras.append(
-                (
-                    "secondary_y: boolean or None (default None)",
-                    """\
-            If True, associate this trace with the secondary y-axis of the
-            subplot at the specified row and col. Only valid if all of the
-            following conditions are satisfied:
-              * The figure was created using `plotly.subplots.make_subplots`.
-              * The row and col arguments are not None
-              * The subplot at the specified row and col has type xy
-                (which is the default) and secondary_y True.  These
-                properties are specified in the specs argument to
-                make_subplots. See the make_subplots docstring for more info.\
-""",
-                )
-            )
-
-        add_docstring(
-            buffer,
-            trace_node,
-            header,
-            append_extras=doc_extras,
-            return_type=fig_classname,
-        )
-
-        # #### Function body ####
-        buffer.write(
-            f"""
-        new_trace = {trace_node.name_datatype_class}(
-        """
-        )
-
-        for i, subtype_node in enumerate(trace_node.child_datatypes):
-            subtype_prop_name = subtype_node.name_property
-            buffer.write(
-                f"""
-                {subtype_prop_name}={subtype_prop_name},"""
-            )
-
-        buffer.write(
-            f"""
-            **kwargs)"""
-        )
-
-        if include_secondary_y:
-            secondary_y_kwarg = ", secondary_y=secondary_y"
-        else:
-            secondary_y_kwarg = ""
-
-        buffer.write(
-            f"""
-        return self.add_trace(
-            new_trace, row=row, col=col{secondary_y_kwarg})"""
-        )
-
-    # update layout subplots
-    # ----------------------
-    inflect_eng = inflect.engine()
-    for subplot_node in subplot_nodes:
-        singular_name = subplot_node.name_property
-        plural_name = inflect_eng.plural_noun(singular_name)
-
-        if singular_name == "yaxis":
-            secondary_y_1 = ", secondary_y=None"
-            secondary_y_2 = ", secondary_y=secondary_y"
-            secondary_y_docstring = f"""
-        secondary_y: boolean or None (default None)
-            * If True, only select yaxis objects associated with the secondary
-              y-axis of the subplot.
-            * If False, only select yaxis objects associated with the primary
-              y-axis of the subplot.
-            * If None (the default), do not filter yaxis objects based on
-              a secondary y-axis condition. 
-            
-            To select yaxis objects by secondary y-axis, the Figure must
-            have been created using plotly.subplots.make_subplots. See
-            the docstring for the specs argument to make_subplots for more
-            info on creating subplots with secondary y-axes."""
-        else:
-            secondary_y_1 = ""
-            secondary_y_2 = ""
-            secondary_y_docstring = ""
-
-        buffer.write(
-            f"""
+# select_*, for_each_*, and update_* methods for a layout subplot type.
+# Specialized below by secondary_y support, then rendered with str.format
+# once per subplot node.
+SUBPLOT_METHODS_TEMPLATE = """
 
     def select_{plural_name}(
             self, selector=None, row=None, col=None{secondary_y_1}):
@@ -351,12 +225,390 @@ class {fig_classname}({base_classname}):\n"""
             obj.update(patch, **kwargs)
 
         return self"""
+
+
+def _specialize_subplot_methods_template(
+    secondary_y_1, secondary_y_2, secondary_y_docstring
+):
+    """
+    Inline the secondary_y fragments into SUBPLOT_METHODS_TEMPLATE, leaving
+    only the {singular_name} and {plural_name} fields to be formatted
+    """
+    return (
+        SUBPLOT_METHODS_TEMPLATE.replace("{secondary_y_1}", secondary_y_1)
+        .replace("{secondary_y_2}", secondary_y_2)
+        .replace("{secondary_y_docstring}", secondary_y_docstring)
+    )
+
+
+# Specialized subplot templates for yaxis (which supports secondary_y
+# filtering) and for all other subplot types
+YAXIS_SUBPLOT_METHODS_TEMPLATE = _specialize_subplot_methods_template(
+    ", secondary_y=None", ", secondary_y=secondary_y", SECONDARY_Y_SELECT_DOCSTRING
+)
+DEFAULT_SUBPLOT_METHODS_TEMPLATE = _specialize_subplot_methods_template("", "", "")
+
+
+# Plural subplot names
+# --------------------
+# build_figure_py is called once per figure class with the same subplot
+# nodes, so cache the plurals rather than re-running inflect's rules
+_inflect_eng = inflect.engine()
+
+
+@lru_cache(maxsize=None)
+def _plural(singular_name):
+    return _inflect_eng.plural_noun(singular_name)
+
+
+class PartsWriter:
+    """
+    Minimal file-like wrapper around a list of strings. Each call to
+    write appends the string to the list, so that codegen helpers that
+    write to a buffer can share build_figure_py's parts accumulator
+    without an intermediate StringIO copy
+    """
+
+    def __init__(self, parts):
+        self.write = parts.append
+
+
+# Prepared render data
+# --------------------
+# Plain data extracted from the schema nodes once per codegen run, so that
+# rendering each figure class is pure string assembly
+FigureRenderData = namedtuple(
+    "FigureRenderData",
+    [
+        "trace_types_csv",
+        "trace_specs",
+        "subplot_specs",
+        "data_description",
+        "layout_description",
+        "frames_description",
+    ],
+)
+
+TraceSpec = namedtuple(
+    "TraceSpec",
+    [
+        "plotly_name",
+        "datatype_class",
+        "include_secondary_y",
+        "prop_names",
+        "params_source",
+        "docstring_source",
+    ],
+)
+
+SubplotSpec = namedtuple("SubplotSpec", ["singular_name", "plural_name"])
+
+# Stands in for the figure class name in the prepared add_<trace> docstrings
+FIG_CLASSNAME_PLACEHOLDER = "{fig_classname}"
+
+
+def prepare_figure_render_data(
+    trace_node, data_description, layout_description, frames_description, subplot_nodes
+):
+    """
+    Extract everything build_figure_py needs from the schema nodes
+
+    Parameters
+    ----------
+    trace_node : PlotlyNode
+        Root trace node (the node that is the parent of all of the
+        individual trace nodes like bar, scatter, etc.)
+    data_description : str
+        Reindented description of the DataValidator instance
+    layout_description : str
+        Reindented description of the LayoutValidator instance
+    frames_description : str
+        Reindented description of the FrameValidator instance
+    subplot_nodes: list of str
+        List of names of all of the layout subplot properties
+
+    Returns
+    -------
+    FigureRenderData
+    """
+    # Get list of trace type nodes
+    # ----------------------------
+    trace_nodes = trace_node.child_compound_datatypes
+
+    # Build trace specs
+    # -----------------
+    trace_specs = []
+    for trace_node in trace_nodes:
+        child_datatypes = trace_node.child_datatypes
+        datatype_class = trace_node.name_datatype_class
+        prop_names = tuple(d.name_property for d in child_datatypes)
+
+        include_secondary_y = "yaxis" in prop_names
+
+        # ### Function params ###
+        param_extras = ["row", "col"]
+        if include_secondary_y:
+            param_extras.append("secondary_y")
+
+        params_parts = []
+        add_constructor_params(
+            PartsWriter(params_parts), child_datatypes, append_extras=param_extras
+        )
+
+        # ### Docstring ###
+        header = f"Add a new {datatype_class} trace"
+
+        if include_secondary_y:
+            doc_extras = DOC_EXTRAS_WITH_SECONDARY_Y
+        else:
+            doc_extras = DOC_EXTRAS
+
+        docstring_parts = []
+        add_docstring(
+            PartsWriter(docstring_parts),
+            trace_node,
+            header,
+            append_extras=doc_extras,
+            return_type=FIG_CLASSNAME_PLACEHOLDER,
+        )
+
+        trace_specs.append(
+            TraceSpec(
+                plotly_name=trace_node.plotly_name,
+                datatype_class=datatype_class,
+                include_secondary_y=include_secondary_y,
+                prop_names=prop_names,
+                params_source="".join(params_parts),
+                docstring_source="".join(docstring_parts),
+            )
+        )
+
+    # Build subplot specs
+    # -------------------
+    subplot_specs = []
+    for subplot_node in subplot_nodes:
+        singular_name = subplot_node.name_property
+        subplot_specs.append(
+            SubplotSpec(singular_name=singular_name, plural_name=_plural(singular_name))
+        )
+
+    return FigureRenderData(
+        trace_types_csv=", ".join(n.name_datatype_class for n in trace_nodes),
+        trace_specs=trace_specs,
+        subplot_specs=subplot_specs,
+        data_description=data_description,
+        layout_description=layout_description,
+        frames_description=frames_description,
+    )
+
+
+def build_figure_py(render_data, base_package, base_classname, fig_classname):
+    """
+
+    Parameters
+    ----------
+    render_data : FigureRenderData
+        Data prepared by prepare_figure_render_data
+    base_package : str
+        Package that the figure's superclass resides in
+    base_classname : str
+        Name of the figure's superclass
+    fig_classname : str
+        Name of the Figure class to be generated
+    Returns
+    -------
+    str
+        Source code for figure class definition
+    """
+
+    # Initialize source code parts
+    # ----------------------------
+    parts = []
+
+    # Write imports, class definition, and constructor
+    # ------------------------------------------------
+    parts.append(
+        FIGURE_HEADER_TEMPLATE.format(
+            base_package=base_package,
+            base_classname=base_classname,
+            fig_classname=fig_classname,
+            trace_types_csv=render_data.trace_types_csv,
+            data_description=render_data.data_description,
+            layout_description=render_data.layout_description,
+            frames_description=render_data.frames_description,
+        )
+    )
+
+    # ### add_trace methods for each trace type ###
+    for trace_spec in render_data.trace_specs:
+
+        # #### Function signature ####
+        parts.append(
+            f"""
+    def add_{trace_spec.plotly_name}(self"""
+        )
+
+        # #### Function params####
+        parts.append(trace_spec.params_source)
+
+        # #### Docstring ####
+        parts.append(
+            trace_spec.docstring_source.replace(
+                FIG_CLASSNAME_PLACEHOLDER, fig_classname
+            )
+        )
+
+        # #### Function body ####
+        parts.append(
+            f"""
+        new_trace = {trace_spec.datatype_class}(
+        """
+        )
+
+        parts.append(
+            "".join(
+                f"""
+                {prop_name}={prop_name},"""
+                for prop_name in trace_spec.prop_names
+            )
+        )
+
+        parts.append(
+            f"""
+            **kwargs)"""
+        )
+
+        if trace_spec.include_secondary_y:
+            secondary_y_kwarg = ", secondary_y=secondary_y"
+        else:
+            secondary_y_kwarg = ""
+
+        parts.append(
+            f"""
+        return self.add_trace(
+            new_trace, row=row, col=col{secondary_y_kwarg})"""
+        )
+
+    # update layout subplots
+    # ----------------------
+    for subplot_spec in render_data.subplot_specs:
+        if subplot_spec.singular_name == "yaxis":
+            subplot_methods_template = YAXIS_SUBPLOT_METHODS_TEMPLATE
+        else:
+            subplot_methods_template = DEFAULT_SUBPLOT_METHODS_TEMPLATE
+
+        parts.append(
+            subplot_methods_template.format(
+                singular_name=subplot_spec.singular_name,
+                plural_name=subplot_spec.plural_name,
+            )
         )
 
     # Return source string
     # --------------------
-    buffer.write("\n")
-    return buffer.getvalue()
+    parts.append("\n")
+    return "".join(parts)
+
+
+# Figure source cache
+# -------------------
+# Rendered figure sources are stored under this directory, in a
+# subdirectory named by the hash of every input that affects the output
+FIGURE_CACHE_DIR = opath.join(opath.dirname(opath.abspath(__file__)), ".codegen-cache")
+
+
+def get_figure_cache_key(
+    trace_node, data_description, layout_description, frames_description, subplot_nodes
+):
+    """
+    Compute the figure source cache key for a set of codegen inputs
+
+    Parameters
+    ----------
+    trace_node : PlotlyNode
+        Root trace node (the node that is the parent of all of the
+        individual trace nodes like bar, scatter, etc.)
+    data_description : str
+        Reindented description of the DataValidator instance
+    layout_description : str
+        Reindented description of the LayoutValidator instance
+    frames_description : str
+        Reindented description of the FrameValidator instance
+    subplot_nodes: list of str
+        List of names of all of the layout subplot properties
+
+    Returns
+    -------
+    str
+        Hex digest that changes whenever the plotly schema, the
+        descriptions, the subplot nodes, or the codegen modules that
+        build the figure source change
+    """
+    key = hashlib.blake2b()
+
+    # ### Schema and descriptions ###
+    key.update(json.dumps(trace_node.plotly_schema, sort_keys=True).encode("utf-8"))
+    for description in (data_description, layout_description, frames_description):
+        key.update(description.encode("utf-8"))
+    for subplot_node in subplot_nodes:
+        key.update(subplot_node.path_str.encode("utf-8"))
+
+    # ### Codegen modules that influence the figure source ###
+    codegen_dir = opath.dirname(opath.abspath(__file__))
+    for module_name in ("figure.py", "datatypes.py", "utils.py"):
+        with open(opath.join(codegen_dir, module_name), "rb") as f:
+            key.update(f.read())
+
+    # ### inflect, which pluralizes the subplot names ###
+    # Recent inflect releases have no __version__, so fall back to hashing
+    # the module source
+    inflect_version = getattr(inflect, "__version__", None)
+    if inflect_version is not None:
+        key.update(inflect_version.encode("utf-8"))
+    else:
+        with open(inflect.__file__, "rb") as f:
+            key.update(f.read())
+
+    return key.hexdigest()
+
+
+def store_figure_cache_source(cache_dir, filename, figure_source):
+    """
+    Store figure source code in the figure source cache
+
+    The source is written to a temporary file that is then moved into
+    place, so an interrupted run never leaves a partial cache entry
+    behind. Cache directories for other keys are removed.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Cache directory for the current cache key
+    filename : str
+        Name of the figure module (e.g. '_figure.py')
+    figure_source : str
+        Figure source code to store
+
+    Returns
+    -------
+    None
+    """
+    cache_root = opath.dirname(cache_dir)
+    if opath.isdir(cache_root):
+        for entry in os.listdir(cache_root):
+            entry_path = opath.join(cache_root, entry)
+            if entry_path != cache_dir and opath.isdir(entry_path):
+                shutil.rmtree(entry_path, ignore_errors=True)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_filepath = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wt") as f:
+            f.write(figure_source)
+        os.replace(tmp_filepath, opath.join(cache_dir, filename))
+    except BaseException:
+        os.remove(tmp_filepath)
+        raise
 
 
 def write_figure_classes(
@@ -396,6 +648,13 @@ def write_figure_classes(
             f'Received node with path "{trace_node.path_str}"'
         )
 
+    # Build constructor description strings
+    # ------------------------------------
+    # These are shared by all figure types, so only reindent them once
+    data_description = reindent_validator_description(data_validator, 8)
+    layout_description = reindent_validator_description(layout_validator, 8)
+    frames_description = reindent_validator_description(frame_validator, 8)
+
     # Loop over figure types
     # ----------------------
     base_figures = [
@@ -403,20 +662,48 @@ def write_figure_classes(
         ("basedatatypes", "BaseFigure", "Figure"),
     ]
 
+    cache_key = get_figure_cache_key(
+        trace_node,
+        data_description,
+        layout_description,
+        frames_description,
+        subplot_nodes,
+    )
+    cache_dir = opath.join(FIGURE_CACHE_DIR, cache_key)
+
+    # Render data is only prepared if a figure class is missing from the
+    # cache, and is then shared by all figure classes
+    render_data = None
+
+    # Note: The figure classes are built sequentially. Each build takes a
+    # fraction of a second, which is less than the cost of pickling the
+    # schema nodes out to worker processes.
     for base_package, base_classname, fig_classname in base_figures:
+        filename = f"_{fig_classname.lower()}.py"
+        cache_filepath = opath.join(cache_dir, filename)
 
-        # ### Build figure source code string ###
-        figure_source = build_figure_py(
-            trace_node,
-            base_package,
-            base_classname,
-            fig_classname,
-            data_validator,
-            layout_validator,
-            frame_validator,
-            subplot_nodes,
-        )
+        if opath.exists(cache_filepath):
+            # ### Reuse cached figure source code string ###
+            with open(cache_filepath, "rt") as f:
+                figure_source = f.read()
+        else:
+            # ### Build figure source code string ###
+            if render_data is None:
+                render_data = prepare_figure_render_data(
+                    trace_node,
+                    data_description,
+                    layout_description,
+                    frames_description,
+                    subplot_nodes,
+                )
+
+            figure_source = build_figure_py(
+                render_data, base_package, base_classname, fig_classname
+            )
+
+            # ### Store in cache ###
+            store_figure_cache_source(cache_dir, filename, figure_source)
 
         # ### Format and write to file###
-        filepath = opath.join(outdir, "graph_objs", f"_{fig_classname.lower()}.py")
+        filepath = opath.join(outdir, "graph_objs", filename)
         write_source_py(figure_source, filepath)
@@ -238,6 +238,10 @@ class PlotlyNode:
         self.plotly_schema = plotly_schema
         self._parent = parent
 
+        # ### Lazily computed child datatype lists ###
+        self._child_datatypes = None
+        self._child_compound_datatypes = None
+
         # ### Process node path ###
         if isinstance(node_path, str):
             node_path = (node_path,)
@@ -810,10 +814,16 @@ class PlotlyNode:
         """
         List of all datatype child nodes
 
+        The list is computed on first access and cached on the node, so it
+        must not be mutated by the caller
+
         Returns
         -------
         list of PlotlyNode
         """
+        if self._child_datatypes is not None:
+            return self._child_datatypes
+
         nodes = []
         for n in self.children:
             if n.is_array:
@@ -858,6 +868,7 @@ class PlotlyNode:
             elif n.is_datatype:
                 nodes.append(n)
 
+        self._child_datatypes = nodes
         return nodes
 
     @property
@@ -865,11 +876,18 @@ class PlotlyNode:
         """
         List of all compound datatype child nodes
 
+        The list is computed on first access and cached on the node, so it
+        must not be mutated by the caller
+
         Returns
         -------
         list of PlotlyNode
         """
-        return [n for n in self.child_datatypes if n.is_compound]
+        if self._child_compound_datatypes is None:
+            self._child_compound_datatypes = [
+                n for n in self.child_datatypes if n.is_compound
+            ]
+        return self._child_compound_datatypes
 
     @property
     def child_simple_datatypes(self) -> List["PlotlyNode"]:
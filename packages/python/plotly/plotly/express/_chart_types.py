@@ -1,7 +1,71 @@
-from ._core import make_figure
+from ._core import make_figure, EMPTY_MAPPING
 from ._doc import make_docstring
 import plotly.graph_objs as go
 
+# Constant trace and layout patches
+# ---------------------------------
+# Built once at import time. Functions that also need per-call entries copy
+# these with dict(PATCH, key=value, ...) or _patch(PATCH, key=value, ...);
+# make_figure copies patches before modifying them.
+DENSITY_CONTOUR_TRACE_PATCH = {
+    "contours": {"coloring": "none"},
+    "xbingroup": "x",
+    "ybingroup": "y",
+}
+
+DENSITY_HEATMAP_TRACE_PATCH = {"xbingroup": "x", "ybingroup": "y"}
+
+STRIP_TRACE_PATCH = {
+    "boxpoints": "all",
+    "pointpos": 0,
+    "hoveron": "points",
+    "fillcolor": "rgba(255,255,255,0)",
+    "line": {"color": "rgba(255,255,255,0)"},
+    "x0": " ",
+    "y0": " ",
+}
+
+AREA_TRACE_PATCH = {"stackgroup": 1, "mode": "lines"}
+
+VIOLIN_TRACE_PATCH = {"scalegroup": True, "x0": " ", "y0": " "}
+
+BOX_TRACE_PATCH = {"x0": " ", "y0": " "}
+
+SCATTER_MATRIX_LAYOUT_PATCH = {"dragmode": "select"}
+
+# Histogram bin axis (used for nbins and bingroup) by orientation
+HISTOGRAM_BIN_AXES = {"v": "x", "h": "y"}
+
+
+def _patch(base=EMPTY_MAPPING, **kwargs):
+    """
+    Return a copy of `base` updated with the keyword arguments whose value is
+    not None. Unset optional arguments are thereby left out of the patch.
+    """
+    patch = dict(base)
+    patch.update((k, v) for k, v in kwargs.items() if v is not None)
+    return patch
+
+
+# Shared choropleth/scatter_geo/line_geo trace patches, one per valid
+# locationmode (plus the default None)
+LOCATIONMODE_TRACE_PATCHES = {
+    mode: {"locationmode": mode}
+    for mode in (None, "ISO-3", "USA-states", "country names")
+}
+
+
+def _locationmode_patch(locationmode):
+    """
+    Return the trace patch for `locationmode`, reusing the shared one for
+    valid values. Invalid values get a fresh patch and are rejected later by
+    the trace constructor.
+    """
+    patch = LOCATIONMODE_TRACE_PATCHES.get(locationmode)
+    if patch is None:
+        patch = {"locationmode": locationmode}
+    return patch
+
 
 def scatter(
     data_frame,
@@ -22,15 +86,15 @@ def scatter(
     error_y_minus=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     color_continuous_scale=None,
     range_color=None,
     color_continuous_midpoint=None,
     symbol_sequence=None,
-    symbol_map={},
+    symbol_map=EMPTY_MAPPING,
     opacity=None,
     size_max=None,
     marginal_x=None,
@@ -50,7 +114,51 @@ def scatter(
     """
     In a scatter plot, each row of `data_frame` is represented by a symbol mark in 2D space.
     """
-    return make_figure(args=locals(), constructor=go.Scatter)
+    args = {
+        "data_frame": data_frame,
+        "x": x,
+        "y": y,
+        "color": color,
+        "symbol": symbol,
+        "size": size,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "text": text,
+        "facet_row": facet_row,
+        "facet_col": facet_col,
+        "error_x": error_x,
+        "error_x_minus": error_x_minus,
+        "error_y": error_y,
+        "error_y_minus": error_y_minus,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "color_continuous_scale": color_continuous_scale,
+        "range_color": range_color,
+        "color_continuous_midpoint": color_continuous_midpoint,
+        "symbol_sequence": symbol_sequence,
+        "symbol_map": symbol_map,
+        "opacity": opacity,
+        "size_max": size_max,
+        "marginal_x": marginal_x,
+        "marginal_y": marginal_y,
+        "trendline": trendline,
+        "trendline_color_override": trendline_color_override,
+        "log_x": log_x,
+        "log_y": log_y,
+        "range_x": range_x,
+        "range_y": range_y,
+        "render_mode": render_mode,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
+    return make_figure(args=args, constructor=go.Scatter)
 
 
 scatter.__doc__ = make_docstring(scatter)
@@ -68,10 +176,10 @@ def density_contour(
     hover_data=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     marginal_x=None,
     marginal_y=None,
     trendline=None,
@@ -94,17 +202,45 @@ def density_contour(
     visualize the 2D distribution of an aggregate function `histfunc` (e.g. the count or sum) \
     of the value `z`.
     """
+    args = {
+        "data_frame": data_frame,
+        "x": x,
+        "y": y,
+        "z": z,
+        "color": color,
+        "facet_row": facet_row,
+        "facet_col": facet_col,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "marginal_x": marginal_x,
+        "marginal_y": marginal_y,
+        "trendline": trendline,
+        "trendline_color_override": trendline_color_override,
+        "log_x": log_x,
+        "log_y": log_y,
+        "range_x": range_x,
+        "range_y": range_y,
+        "histfunc": histfunc,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
     return make_figure(
-        args=locals(),
+        args=args,
         constructor=go.Histogram2dContour,
-        trace_patch=dict(
-            contours=dict(coloring="none"),
+        trace_patch=_patch(
+            DENSITY_CONTOUR_TRACE_PATCH,
             histfunc=histfunc,
             histnorm=histnorm,
             nbinsx=nbinsx,
             nbinsy=nbinsy,
-            xbingroup="x",
-            ybingroup="y",
         ),
     )
 
@@ -123,8 +259,8 @@ def density_heatmap(
     hover_data=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_continuous_scale=None,
     range_color=None,
     color_continuous_midpoint=None,
@@ -149,16 +285,44 @@ def density_heatmap(
     rectangular tiles to visualize the 2D distribution of an aggregate function \
     `histfunc` (e.g. the count or sum) of the value `z`.
     """
+    args = {
+        "data_frame": data_frame,
+        "x": x,
+        "y": y,
+        "z": z,
+        "facet_row": facet_row,
+        "facet_col": facet_col,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_continuous_scale": color_continuous_scale,
+        "range_color": range_color,
+        "color_continuous_midpoint": color_continuous_midpoint,
+        "marginal_x": marginal_x,
+        "marginal_y": marginal_y,
+        "opacity": opacity,
+        "log_x": log_x,
+        "log_y": log_y,
+        "range_x": range_x,
+        "range_y": range_y,
+        "histfunc": histfunc,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
     return make_figure(
-        args=locals(),
+        args=args,
         constructor=go.Histogram2d,
-        trace_patch=dict(
+        trace_patch=_patch(
+            DENSITY_HEATMAP_TRACE_PATCH,
             histfunc=histfunc,
             histnorm=histnorm,
             nbinsx=nbinsx,
             nbinsy=nbinsy,
-            xbingroup="x",
-            ybingroup="y",
         ),
     )
 
@@ -185,12 +349,12 @@ def line(
     error_y_minus=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     line_dash_sequence=None,
-    line_dash_map={},
+    line_dash_map=EMPTY_MAPPING,
     log_x=False,
     log_y=False,
     range_x=None,
@@ -205,7 +369,43 @@ def line(
     """
     In a 2D line plot, each row of `data_frame` is represented as vertex of a polyline mark in 2D space.
     """
-    return make_figure(args=locals(), constructor=go.Scatter)
+    args = {
+        "data_frame": data_frame,
+        "x": x,
+        "y": y,
+        "line_group": line_group,
+        "color": color,
+        "line_dash": line_dash,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "text": text,
+        "facet_row": facet_row,
+        "facet_col": facet_col,
+        "error_x": error_x,
+        "error_x_minus": error_x_minus,
+        "error_y": error_y,
+        "error_y_minus": error_y_minus,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "line_dash_sequence": line_dash_sequence,
+        "line_dash_map": line_dash_map,
+        "log_x": log_x,
+        "log_y": log_y,
+        "range_x": range_x,
+        "range_y": range_y,
+        "line_shape": line_shape,
+        "render_mode": render_mode,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
+    return make_figure(args=args, constructor=go.Scatter)
 
 
 line.__doc__ = make_docstring(line)
@@ -225,10 +425,10 @@ def area(
     facet_col=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     orientation="v",
     groupnorm=None,
     log_x=False,
@@ -244,11 +444,39 @@ def area(
     """
     In a stacked area plot, each row of `data_frame` is represented as vertex of a polyline mark in 2D space. The area between successive polylines is filled.
     """
+    args = {
+        "data_frame": data_frame,
+        "x": x,
+        "y": y,
+        "line_group": line_group,
+        "color": color,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "text": text,
+        "facet_row": facet_row,
+        "facet_col": facet_col,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "log_x": log_x,
+        "log_y": log_y,
+        "range_x": range_x,
+        "range_y": range_y,
+        "line_shape": line_shape,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
     return make_figure(
-        args=locals(),
+        args=args,
         constructor=go.Scatter,
         trace_patch=dict(
-            stackgroup=1, mode="lines", orientation=orientation, groupnorm=groupnorm
+            AREA_TRACE_PATCH, orientation=orientation, groupnorm=groupnorm
         ),
     )
 
@@ -273,10 +501,10 @@ def bar(
     error_y_minus=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     color_continuous_scale=None,
     range_color=None,
     color_continuous_midpoint=None,
@@ -295,11 +523,46 @@ def bar(
     """
     In a bar plot, each row of `data_frame` is represented as a rectangular mark.
     """
+    args = {
+        "data_frame": data_frame,
+        "x": x,
+        "y": y,
+        "color": color,
+        "facet_row": facet_row,
+        "facet_col": facet_col,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "text": text,
+        "error_x": error_x,
+        "error_x_minus": error_x_minus,
+        "error_y": error_y,
+        "error_y_minus": error_y_minus,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "color_continuous_scale": color_continuous_scale,
+        "range_color": range_color,
+        "color_continuous_midpoint": color_continuous_midpoint,
+        "opacity": opacity,
+        "barmode": barmode,
+        "log_x": log_x,
+        "log_y": log_y,
+        "range_x": range_x,
+        "range_y": range_y,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
     return make_figure(
-        args=locals(),
+        args=args,
         constructor=go.Bar,
-        trace_patch=dict(orientation=orientation, textposition="auto"),
-        layout_patch=dict(barmode=barmode),
+        trace_patch={"orientation": orientation, "textposition": "auto"},
+        layout_patch={"barmode": barmode},
     )
 
 
@@ -317,10 +580,10 @@ def histogram(
     hover_data=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     marginal=None,
     opacity=None,
     orientation="v",
@@ -344,19 +607,50 @@ def histogram(
     visualize the 1D distribution of an aggregate function `histfunc` (e.g. the count or sum) \
     of the value `y` (or `x` if `orientation` is `'h'`).
     """
+    args = {
+        "data_frame": data_frame,
+        "x": x,
+        "y": y,
+        "color": color,
+        "facet_row": facet_row,
+        "facet_col": facet_col,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "marginal": marginal,
+        "opacity": opacity,
+        "orientation": orientation,
+        "barmode": barmode,
+        "log_x": log_x,
+        "log_y": log_y,
+        "range_x": range_x,
+        "range_y": range_y,
+        "histfunc": histfunc,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
+    # Bin along x for vertical histograms and along y otherwise
+    bin_axis = HISTOGRAM_BIN_AXES.get(orientation, "y")
+    trace_patch = _patch(
+        {"cumulative": {"enabled": cumulative}, "bingroup": bin_axis},
+        orientation=orientation,
+        histnorm=histnorm,
+        histfunc=histfunc,
+    )
+    if nbins is not None:
+        trace_patch["nbins" + bin_axis] = nbins
     return make_figure(
-        args=locals(),
+        args=args,
         constructor=go.Histogram,
-        trace_patch=dict(
-            orientation=orientation,
-            histnorm=histnorm,
-            histfunc=histfunc,
-            nbinsx=nbins if orientation == "v" else None,
-            nbinsy=None if orientation == "v" else nbins,
-            cumulative=dict(enabled=cumulative),
-            bingroup="x" if orientation == "v" else "y",
-        ),
-        layout_patch=dict(barmode=barmode, barnorm=barnorm),
+        trace_patch=trace_patch,
+        layout_patch=_patch(barmode=barmode, barnorm=barnorm),
     )
 
 
@@ -375,10 +669,10 @@ def violin(
     custom_data=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     orientation="v",
     violinmode="group",
     log_x=False,
@@ -396,18 +690,41 @@ def violin(
     In a violin plot, rows of `data_frame` are grouped together into a curved mark to \
     visualize their distribution.
     """
+    args = {
+        "data_frame": data_frame,
+        "x": x,
+        "y": y,
+        "color": color,
+        "facet_row": facet_row,
+        "facet_col": facet_col,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "log_x": log_x,
+        "log_y": log_y,
+        "range_x": range_x,
+        "range_y": range_y,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
     return make_figure(
-        args=locals(),
+        args=args,
         constructor=go.Violin,
         trace_patch=dict(
+            VIOLIN_TRACE_PATCH,
             orientation=orientation,
             points=points,
-            box=dict(visible=box),
-            scalegroup=True,
-            x0=" ",
-            y0=" ",
+            box={"visible": box},
         ),
-        layout_patch=dict(violinmode=violinmode),
+        layout_patch={"violinmode": violinmode},
     )
 
 
@@ -426,10 +743,10 @@ def box(
     custom_data=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     orientation="v",
     boxmode="group",
     log_x=False,
@@ -447,13 +764,38 @@ def box(
     In a box plot, rows of `data_frame` are grouped together into a box-and-whisker mark to \
     visualize their distribution.
     """
+    args = {
+        "data_frame": data_frame,
+        "x": x,
+        "y": y,
+        "color": color,
+        "facet_row": facet_row,
+        "facet_col": facet_col,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "log_x": log_x,
+        "log_y": log_y,
+        "range_x": range_x,
+        "range_y": range_y,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
     return make_figure(
-        args=locals(),
+        args=args,
         constructor=go.Box,
         trace_patch=dict(
-            orientation=orientation, boxpoints=points, notched=notched, x0=" ", y0=" "
+            BOX_TRACE_PATCH, orientation=orientation, boxpoints=points, notched=notched
         ),
-        layout_patch=dict(boxmode=boxmode),
+        layout_patch={"boxmode": boxmode},
     )
 
 
@@ -472,10 +814,10 @@ def strip(
     custom_data=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     orientation="v",
     stripmode="group",
     log_x=False,
@@ -490,20 +832,36 @@ def strip(
     """
     In a strip plot each row of `data_frame` is represented as a jittered mark within categories.
     """
+    args = {
+        "data_frame": data_frame,
+        "x": x,
+        "y": y,
+        "color": color,
+        "facet_row": facet_row,
+        "facet_col": facet_col,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "log_x": log_x,
+        "log_y": log_y,
+        "range_x": range_x,
+        "range_y": range_y,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
     return make_figure(
-        args=locals(),
+        args=args,
         constructor=go.Box,
-        trace_patch=dict(
-            orientation=orientation,
-            boxpoints="all",
-            pointpos=0,
-            hoveron="points",
-            fillcolor="rgba(255,255,255,0)",
-            line={"color": "rgba(255,255,255,0)"},
-            x0=" ",
-            y0=" ",
-        ),
-        layout_patch=dict(boxmode=stripmode),
+        trace_patch=dict(STRIP_TRACE_PATCH, orientation=orientation),
+        layout_patch={"boxmode": stripmode},
     )
 
 
@@ -530,16 +888,16 @@ def scatter_3d(
     error_z_minus=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     size_max=None,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     color_continuous_scale=None,
     range_color=None,
     color_continuous_midpoint=None,
     symbol_sequence=None,
-    symbol_map={},
+    symbol_map=EMPTY_MAPPING,
     opacity=None,
     log_x=False,
     log_y=False,
@@ -555,7 +913,49 @@ def scatter_3d(
     """
     In a 3D scatter plot, each row of `data_frame` is represented by a symbol mark in 3D space.
     """
-    return make_figure(args=locals(), constructor=go.Scatter3d)
+    args = {
+        "data_frame": data_frame,
+        "x": x,
+        "y": y,
+        "z": z,
+        "color": color,
+        "symbol": symbol,
+        "size": size,
+        "text": text,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "error_x": error_x,
+        "error_x_minus": error_x_minus,
+        "error_y": error_y,
+        "error_y_minus": error_y_minus,
+        "error_z": error_z,
+        "error_z_minus": error_z_minus,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "size_max": size_max,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "color_continuous_scale": color_continuous_scale,
+        "range_color": range_color,
+        "color_continuous_midpoint": color_continuous_midpoint,
+        "symbol_sequence": symbol_sequence,
+        "symbol_map": symbol_map,
+        "opacity": opacity,
+        "log_x": log_x,
+        "log_y": log_y,
+        "log_z": log_z,
+        "range_x": range_x,
+        "range_y": range_y,
+        "range_z": range_z,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
+    return make_figure(args=args, constructor=go.Scatter3d)
 
 
 scatter_3d.__doc__ = make_docstring(scatter_3d)
@@ -581,12 +981,12 @@ def line_3d(
     error_z_minus=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     line_dash_sequence=None,
-    line_dash_map={},
+    line_dash_map=EMPTY_MAPPING,
     log_x=False,
     log_y=False,
     log_z=False,
@@ -601,7 +1001,44 @@ def line_3d(
     """
     In a 3D line plot, each row of `data_frame` is represented as vertex of a polyline mark in 3D space.
     """
-    return make_figure(args=locals(), constructor=go.Scatter3d)
+    args = {
+        "data_frame": data_frame,
+        "x": x,
+        "y": y,
+        "z": z,
+        "color": color,
+        "line_dash": line_dash,
+        "text": text,
+        "line_group": line_group,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "error_x": error_x,
+        "error_x_minus": error_x_minus,
+        "error_y": error_y,
+        "error_y_minus": error_y_minus,
+        "error_z": error_z,
+        "error_z_minus": error_z_minus,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "line_dash_sequence": line_dash_sequence,
+        "line_dash_map": line_dash_map,
+        "log_x": log_x,
+        "log_y": log_y,
+        "log_z": log_z,
+        "range_x": range_x,
+        "range_y": range_y,
+        "range_z": range_z,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
+    return make_figure(args=args, constructor=go.Scatter3d)
 
 
 line_3d.__doc__ = make_docstring(line_3d)
@@ -621,15 +1058,15 @@ def scatter_ternary(
     custom_data=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     color_continuous_scale=None,
     range_color=None,
     color_continuous_midpoint=None,
     symbol_sequence=None,
-    symbol_map={},
+    symbol_map=EMPTY_MAPPING,
     opacity=None,
     size_max=None,
     title=None,
@@ -640,7 +1077,37 @@ def scatter_ternary(
     """
     In a ternary scatter plot, each row of `data_frame` is represented by a symbol mark in ternary coordinates.
     """
-    return make_figure(args=locals(), constructor=go.Scatterternary)
+    args = {
+        "data_frame": data_frame,
+        "a": a,
+        "b": b,
+        "c": c,
+        "color": color,
+        "symbol": symbol,
+        "size": size,
+        "text": text,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "color_continuous_scale": color_continuous_scale,
+        "range_color": range_color,
+        "color_continuous_midpoint": color_continuous_midpoint,
+        "symbol_sequence": symbol_sequence,
+        "symbol_map": symbol_map,
+        "opacity": opacity,
+        "size_max": size_max,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
+    return make_figure(args=args, constructor=go.Scatterternary)
 
 
 scatter_ternary.__doc__ = make_docstring(scatter_ternary)
@@ -660,12 +1127,12 @@ def line_ternary(
     text=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     line_dash_sequence=None,
-    line_dash_map={},
+    line_dash_map=EMPTY_MAPPING,
     line_shape=None,
     title=None,
     template=None,
@@ -675,7 +1142,33 @@ def line_ternary(
     """
     In a ternary line plot, each row of `data_frame` is represented as vertex of a polyline mark in ternary coordinates.
     """
-    return make_figure(args=locals(), constructor=go.Scatterternary)
+    args = {
+        "data_frame": data_frame,
+        "a": a,
+        "b": b,
+        "c": c,
+        "color": color,
+        "line_dash": line_dash,
+        "line_group": line_group,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "text": text,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "line_dash_sequence": line_dash_sequence,
+        "line_dash_map": line_dash_map,
+        "line_shape": line_shape,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
+    return make_figure(args=args, constructor=go.Scatterternary)
 
 
 line_ternary.__doc__ = make_docstring(line_ternary)
@@ -694,15 +1187,15 @@ def scatter_polar(
     text=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     color_continuous_scale=None,
     range_color=None,
     color_continuous_midpoint=None,
     symbol_sequence=None,
-    symbol_map={},
+    symbol_map=EMPTY_MAPPING,
     opacity=None,
     direction="clockwise",
     start_angle=90,
@@ -719,7 +1212,41 @@ def scatter_polar(
     In a polar scatter plot, each row of `data_frame` is represented by a symbol mark in
     polar coordinates.
     """
-    return make_figure(args=locals(), constructor=go.Scatterpolar)
+    args = {
+        "data_frame": data_frame,
+        "r": r,
+        "theta": theta,
+        "color": color,
+        "symbol": symbol,
+        "size": size,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "text": text,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "color_continuous_scale": color_continuous_scale,
+        "range_color": range_color,
+        "color_continuous_midpoint": color_continuous_midpoint,
+        "symbol_sequence": symbol_sequence,
+        "symbol_map": symbol_map,
+        "opacity": opacity,
+        "direction": direction,
+        "start_angle": start_angle,
+        "size_max": size_max,
+        "range_r": range_r,
+        "log_r": log_r,
+        "render_mode": render_mode,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
+    return make_figure(args=args, constructor=go.Scatterpolar)
 
 
 scatter_polar.__doc__ = make_docstring(scatter_polar)
@@ -738,12 +1265,12 @@ def line_polar(
     text=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     line_dash_sequence=None,
-    line_dash_map={},
+    line_dash_map=EMPTY_MAPPING,
     direction="clockwise",
     start_angle=90,
     line_close=False,
@@ -759,7 +1286,38 @@ def line_polar(
     """
     In a polar line plot, each row of `data_frame` is represented as vertex of a polyline mark in polar coordinates.
     """
-    return make_figure(args=locals(), constructor=go.Scatterpolar)
+    args = {
+        "data_frame": data_frame,
+        "r": r,
+        "theta": theta,
+        "color": color,
+        "line_dash": line_dash,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "line_group": line_group,
+        "text": text,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "line_dash_sequence": line_dash_sequence,
+        "line_dash_map": line_dash_map,
+        "direction": direction,
+        "start_angle": start_angle,
+        "line_close": line_close,
+        "line_shape": line_shape,
+        "render_mode": render_mode,
+        "range_r": range_r,
+        "log_r": log_r,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
+    return make_figure(args=args, constructor=go.Scatterpolar)
 
 
 line_polar.__doc__ = make_docstring(line_polar)
@@ -775,10 +1333,10 @@ def bar_polar(
     custom_data=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     barnorm="",
     barmode="relative",
     direction="clockwise",
@@ -793,10 +1351,34 @@ def bar_polar(
     """
     In a polar bar plot, each row of `data_frame` is represented as a wedge mark in polar coordinates.
     """
+    args = {
+        "data_frame": data_frame,
+        "r": r,
+        "theta": theta,
+        "color": color,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "barmode": barmode,
+        "direction": direction,
+        "start_angle": start_angle,
+        "range_r": range_r,
+        "log_r": log_r,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
     return make_figure(
-        args=locals(),
+        args=args,
         constructor=go.Barpolar,
-        layout_patch=dict(barnorm=barnorm, barmode=barmode),
+        layout_patch={"barnorm": barnorm, "barmode": barmode},
     )
 
 
@@ -816,8 +1398,8 @@ def choropleth(
     size=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_continuous_scale=None,
     range_color=None,
     color_continuous_midpoint=None,
@@ -833,10 +1415,36 @@ def choropleth(
     """
     In a choropleth map, each row of `data_frame` is represented by a colored region mark on a map.
     """
+    args = {
+        "data_frame": data_frame,
+        "lat": lat,
+        "lon": lon,
+        "locations": locations,
+        "color": color,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "size": size,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_continuous_scale": color_continuous_scale,
+        "range_color": range_color,
+        "color_continuous_midpoint": color_continuous_midpoint,
+        "size_max": size_max,
+        "projection": projection,
+        "scope": scope,
+        "center": center,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
     return make_figure(
-        args=locals(),
+        args=args,
         constructor=go.Choropleth,
-        trace_patch=dict(locationmode=locationmode),
+        trace_patch=_locationmode_patch(locationmode),
     )
 
 
@@ -857,10 +1465,10 @@ def scatter_geo(
     size=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     color_continuous_scale=None,
     range_color=None,
     color_continuous_midpoint=None,
@@ -877,10 +1485,40 @@ def scatter_geo(
     """
     In a geographic scatter plot, each row of `data_frame` is represented by a symbol mark on a map.
     """
+    args = {
+        "data_frame": data_frame,
+        "lat": lat,
+        "lon": lon,
+        "locations": locations,
+        "color": color,
+        "text": text,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "size": size,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "color_continuous_scale": color_continuous_scale,
+        "range_color": range_color,
+        "color_continuous_midpoint": color_continuous_midpoint,
+        "opacity": opacity,
+        "size_max": size_max,
+        "projection": projection,
+        "scope": scope,
+        "center": center,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
     return make_figure(
-        args=locals(),
+        args=args,
         constructor=go.Scattergeo,
-        trace_patch=dict(locationmode=locationmode),
+        trace_patch=_locationmode_patch(locationmode),
     )
 
 
@@ -902,12 +1540,12 @@ def line_geo(
     line_group=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     line_dash_sequence=None,
-    line_dash_map={},
+    line_dash_map=EMPTY_MAPPING,
     projection=None,
     scope=None,
     center=None,
@@ -919,10 +1557,38 @@ def line_geo(
     """
     In a geographic line plot, each row of `data_frame` is represented as vertex of a polyline mark on a map.
     """
+    args = {
+        "data_frame": data_frame,
+        "lat": lat,
+        "lon": lon,
+        "locations": locations,
+        "color": color,
+        "line_dash": line_dash,
+        "text": text,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "line_group": line_group,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "line_dash_sequence": line_dash_sequence,
+        "line_dash_map": line_dash_map,
+        "projection": projection,
+        "scope": scope,
+        "center": center,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
     return make_figure(
-        args=locals(),
+        args=args,
         constructor=go.Scattergeo,
-        trace_patch=dict(locationmode=locationmode),
+        trace_patch=_locationmode_patch(locationmode),
     )
 
 
@@ -941,10 +1607,10 @@ def scatter_mapbox(
     size=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     color_continuous_scale=None,
     range_color=None,
     color_continuous_midpoint=None,
@@ -959,7 +1625,34 @@ def scatter_mapbox(
     """
     In a Mapbox scatter plot, each row of `data_frame` is represented by a symbol mark on a Mapbox map.
     """
-    return make_figure(args=locals(), constructor=go.Scattermapbox)
+    args = {
+        "data_frame": data_frame,
+        "lat": lat,
+        "lon": lon,
+        "color": color,
+        "text": text,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "size": size,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "color_continuous_scale": color_continuous_scale,
+        "range_color": range_color,
+        "color_continuous_midpoint": color_continuous_midpoint,
+        "opacity": opacity,
+        "size_max": size_max,
+        "zoom": zoom,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
+    return make_figure(args=args, constructor=go.Scattermapbox)
 
 
 scatter_mapbox.__doc__ = make_docstring(scatter_mapbox)
@@ -977,10 +1670,10 @@ def line_mapbox(
     line_group=None,
     animation_frame=None,
     animation_group=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     zoom=8,
     title=None,
     template=None,
@@ -990,7 +1683,29 @@ def line_mapbox(
     """
     In a Mapbox line plot, each row of `data_frame` is represented as vertex of a polyline mark on a Mapbox map.
     """
-    return make_figure(args=locals(), constructor=go.Scattermapbox)
+    args = {
+        "data_frame": data_frame,
+        "lat": lat,
+        "lon": lon,
+        "color": color,
+        "text": text,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "line_group": line_group,
+        "animation_frame": animation_frame,
+        "animation_group": animation_group,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "zoom": zoom,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
+    return make_figure(args=args, constructor=go.Scattermapbox)
 
 
 line_mapbox.__doc__ = make_docstring(line_mapbox)
@@ -1005,15 +1720,15 @@ def scatter_matrix(
     hover_name=None,
     hover_data=None,
     custom_data=None,
-    category_orders={},
-    labels={},
+    category_orders=EMPTY_MAPPING,
+    labels=EMPTY_MAPPING,
     color_discrete_sequence=None,
-    color_discrete_map={},
+    color_discrete_map=EMPTY_MAPPING,
     color_continuous_scale=None,
     range_color=None,
     color_continuous_midpoint=None,
     symbol_sequence=None,
-    symbol_map={},
+    symbol_map=EMPTY_MAPPING,
     opacity=None,
     size_max=None,
     title=None,
@@ -1026,8 +1741,33 @@ def scatter_matrix(
     by a multiple symbol marks, one in each cell of a grid of 2D scatter plots, which \
     plot each pair of `dimensions` against each other.
     """
+    args = {
+        "data_frame": data_frame,
+        "dimensions": dimensions,
+        "color": color,
+        "symbol": symbol,
+        "size": size,
+        "hover_name": hover_name,
+        "hover_data": hover_data,
+        "custom_data": custom_data,
+        "category_orders": category_orders,
+        "labels": labels,
+        "color_discrete_sequence": color_discrete_sequence,
+        "color_discrete_map": color_discrete_map,
+        "color_continuous_scale": color_continuous_scale,
+        "range_color": range_color,
+        "color_continuous_midpoint": color_continuous_midpoint,
+        "symbol_sequence": symbol_sequence,
+        "symbol_map": symbol_map,
+        "opacity": opacity,
+        "size_max": size_max,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
     return make_figure(
-        args=locals(), constructor=go.Splom, layout_patch=dict(dragmode="select")
+        args=args, constructor=go.Splom, layout_patch=SCATTER_MATRIX_LAYOUT_PATCH
     )
 
 
@@ -1038,7 +1778,7 @@ def parallel_coordinates(
     data_frame,
     dimensions=None,
     color=None,
-    labels={},
+    labels=EMPTY_MAPPING,
     color_continuous_scale=None,
     range_color=None,
     color_continuous_midpoint=None,
@@ -1052,7 +1792,20 @@ def parallel_coordinates(
     by a polyline mark which traverses a set of parallel axes, one for each of the \
     `dimensions`.
     """
-    return make_figure(args=locals(), constructor=go.Parcoords)
+    args = {
+        "data_frame": data_frame,
+        "dimensions": dimensions,
+        "color": color,
+        "labels": labels,
+        "color_continuous_scale": color_continuous_scale,
+        "range_color": range_color,
+        "color_continuous_midpoint": color_continuous_midpoint,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
+    return make_figure(args=args, constructor=go.Parcoords)
 
 
 parallel_coordinates.__doc__ = make_docstring(parallel_coordinates)
@@ -1062,7 +1815,7 @@ def parallel_categories(
     data_frame,
     dimensions=None,
     color=None,
-    labels={},
+    labels=EMPTY_MAPPING,
     color_continuous_scale=None,
     range_color=None,
     color_continuous_midpoint=None,
@@ -1076,7 +1829,20 @@ def parallel_categories(
     grouped with other rows that share the same values of `dimensions` and then plotted \
     as a polyline mark through a set of parallel axes, one for each of the `dimensions`.
     """
-    return make_figure(args=locals(), constructor=go.Parcats)
+    args = {
+        "data_frame": data_frame,
+        "dimensions": dimensions,
+        "color": color,
+        "labels": labels,
+        "color_continuous_scale": color_continuous_scale,
+        "range_color": range_color,
+        "color_continuous_midpoint": color_continuous_midpoint,
+        "title": title,
+        "template": template,
+        "width": width,
+        "height": height,
+    }
+    return make_figure(args=args, constructor=go.Parcats)
 
 
 parallel_categories.__doc__ = make_docstring(parallel_categories)
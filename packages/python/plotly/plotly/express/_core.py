@@ -32,6 +32,16 @@ del PxDefaults
 
 MAPBOX_TOKEN = None
 
+# Shared read-only default for the mapping arguments of the plotly express
+# functions (e.g. `labels` or `category_orders`). Anything that needs to
+# modify one of these arguments must copy it first.
+try:
+    from types import MappingProxyType
+
+    EMPTY_MAPPING = MappingProxyType({})
+except ImportError:  # Python 2
+    EMPTY_MAPPING = {}
+
 
 def set_mapbox_access_token(token):
     """
@@ -899,7 +909,9 @@ def get_orderings(args, grouper, grouped):
     return orders, group_names
 
 
-def make_figure(args, constructor, trace_patch={}, layout_patch={}):
+def make_figure(
+    args, constructor, trace_patch=EMPTY_MAPPING, layout_patch=EMPTY_MAPPING
+):
     apply_default_cascade(args)
 
     trace_specs, grouped_mappings, sizeref, show_colorbar = infer_config(
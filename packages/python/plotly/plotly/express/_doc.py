@@ -1,5 +1,3 @@
-import inspect
-
 colref = "(string: name of column in `data_frame`)"
 colref_list = "(list of string: names of columns in `data_frame`)"
 
@@ -352,15 +350,29 @@ docs = dict(
 )
 
 
-def make_docstring(fn):
-    result = (fn.__doc__ or "") + "\nArguments:\n"
-    for arg in inspect.getargspec(fn)[0]:
+# Formatted "    arg: description" lines, keyed by argument name. Most
+# arguments are shared by many of the plotly express functions, so each
+# line is only formatted once
+_arg_docs = {}
+
+
+def _arg_doc(arg):
+    if arg not in _arg_docs:
         d = (
             " ".join(docs[arg] or "")
             if arg in docs
             else "(documentation missing from map)"
         )
-        result += "    %s: %s\n" % (arg, d)
+        _arg_docs[arg] = "    %s: %s\n" % (arg, d)
+    return _arg_docs[arg]
+
+
+def make_docstring(fn):
+    result = (fn.__doc__ or "") + "\nArguments:\n"
+    # Positional parameter names straight from the code object, which is
+    # cheaper than building a full argspec for every wrapper at import time
+    code = fn.__code__
+    result += "".join(_arg_doc(arg) for arg in code.co_varnames[: code.co_argcount])
     result += "Returns:\n"
     result += "    A `Figure` object."
     return result
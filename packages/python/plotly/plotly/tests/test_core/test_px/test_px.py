@@ -1,6 +1,32 @@
+import inspect
+import sys
+
 import plotly.express as px
+import plotly.express._chart_types as chart_types
 import numpy as np
 
+if sys.version_info.major == 3 and sys.version_info.minor >= 3:
+    import unittest.mock as mock
+else:
+    import mock
+
+# Wrapper parameters that only reach the figure through trace_patch or
+# layout_patch and are therefore left out of the args passed to make_figure
+PATCH_ONLY_ARGS = {
+    "area": {"orientation", "groupnorm"},
+    "bar": {"orientation"},
+    "histogram": {"histnorm", "nbins", "cumulative", "barnorm"},
+    "violin": {"orientation", "violinmode", "points", "box"},
+    "box": {"orientation", "boxmode", "points", "notched"},
+    "strip": {"orientation", "stripmode"},
+    "density_contour": {"histnorm", "nbinsx", "nbinsy"},
+    "density_heatmap": {"histnorm", "nbinsx", "nbinsy"},
+    "bar_polar": {"barnorm"},
+    "choropleth": {"locationmode"},
+    "scatter_geo": {"locationmode"},
+    "line_geo": {"locationmode"},
+}
+
 
 def test_scatter():
     iris = px.data.iris()
@@ -51,3 +77,19 @@ def test_custom_data_scatter():
         fig.data[0].hovertemplate
         == "sepal_width=%{x}<br>sepal_length=%{y}<br>petal_length=%{customdata[2]}<br>petal_width=%{customdata[3]}<br>species_id=%{customdata[0]}"
     )
+
+
+def test_wrapper_args_match_signature():
+    wrappers = [
+        (name, fn)
+        for name, fn in inspect.getmembers(chart_types, inspect.isfunction)
+        if fn.__module__ == chart_types.__name__ and not name.startswith("_")
+    ]
+    assert wrappers
+    for name, fn in wrappers:
+        code = fn.__code__
+        params = set(code.co_varnames[: code.co_argcount])
+        with mock.patch.object(chart_types, "make_figure") as make_figure:
+            fn(None)
+        args = make_figure.call_args[1]["args"]
+        assert set(args) == params - PATCH_ONLY_ARGS.get(name, set()), name
@@ -8,7 +8,10 @@ from plotly.subplots import make_subplots
 
 
 class TestSelectForEachUpdateTraces(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        # Build the figures once. The select_traces tests only read them;
+        # tests that modify traces work on a copy (see copy_figure).
         fig = make_subplots(
             rows=3,
             cols=2,
@@ -100,8 +103,11 @@ class TestSelectForEachUpdateTraces(TestCase):
             secondary_y=True,
         )
 
-        self.fig = fig
-        self.fig_no_grid = go.Figure(self.fig.to_dict())
+        cls.fig = fig
+        cls.fig_no_grid = go.Figure(fig.to_dict())
+
+    def copy_figure(self):
+        self.fig = copy.deepcopy(type(self).fig)
 
     # select_traces and for_each_trace
     # --------------------------------
@@ -114,6 +120,7 @@ class TestSelectForEachUpdateTraces(TestCase):
         secondary_y=None,
         test_no_grid=False,
     ):
+        expected = [self.fig.data[i] for i in expected_inds]
 
         # Select traces on figure initialized with make_subplots
         trace_generator = self.fig.select_traces(
@@ -121,18 +128,15 @@ class TestSelectForEachUpdateTraces(TestCase):
         )
         self.assertTrue(inspect.isgenerator(trace_generator))
 
-        trace_list = list(trace_generator)
-        self.assertEqual(trace_list, [self.fig.data[i] for i in expected_inds])
+        self.assertEqual(list(trace_generator), expected)
 
         # Select traces on figure not containing subplot info
         if test_no_grid:
             trace_generator = self.fig_no_grid.select_traces(
                 selector=selector, row=row, col=col, secondary_y=secondary_y
             )
-            trace_list = list(trace_generator)
-            self.assertEqual(
-                trace_list, [self.fig_no_grid.data[i] for i in expected_inds]
-            )
+            expected_no_grid = [self.fig_no_grid.data[i] for i in expected_inds]
+            self.assertEqual(list(trace_generator), expected_no_grid)
 
         # Test for each trace
         trace_list = []
@@ -145,7 +149,7 @@ class TestSelectForEachUpdateTraces(TestCase):
         )
         self.assertIs(for_each_res, self.fig)
 
-        self.assertEqual(trace_list, [self.fig.data[i] for i in expected_inds])
+        self.assertEqual(trace_list, expected)
 
     def test_select_by_type(self):
         self.assert_select_traces(
@@ -226,6 +230,8 @@ class TestSelectForEachUpdateTraces(TestCase):
         self.assert_select_traces([], selector={"type": "markers"}, row=3, col=1)
 
     def test_for_each_trace_lowercase_names(self):
+        self.copy_figure()
+
         # Names are all uppercase to start
         original_names = [t.name for t in self.fig.data]
         self.assertTrue([str.isupper(n) for n in original_names])
@@ -253,10 +259,8 @@ class TestSelectForEachUpdateTraces(TestCase):
         secondary_y=None,
         **kwargs
     ):
-        # Save off original figure
-        fig_orig = copy.deepcopy(self.fig)
-        for trace1, trace2 in zip(fig_orig.data, self.fig.data):
-            trace1.uid = trace2.uid
+        # Snapshot the original traces as plain dicts
+        traces_orig = [t.to_plotly_json() for t in self.fig.data]
 
         # Perform update
         update_res = self.fig.update_traces(
@@ -272,18 +276,23 @@ class TestSelectForEachUpdateTraces(TestCase):
         self.assertIs(update_res, self.fig)
 
         # Check resulting traces
-        for i, (t_orig, t) in enumerate(zip(fig_orig.data, self.fig.data)):
+        for i, (t_orig, t) in enumerate(zip(traces_orig, self.fig.data)):
+            t_json = t.to_plotly_json()
             if i in expected_inds:
                 # Check that traces are initially equal
-                self.assertNotEqual(t_orig, t)
+                self.assertNotEqual(t_orig, t_json)
 
                 # Check that traces are equal after update
-                t_orig.update(patch, **kwargs)
+                t_expected = type(t)(t_orig)
+                t_expected.update(patch, **kwargs)
+                t_orig = t_expected.to_plotly_json()
 
             # Check that traces are equal
-            self.assertEqual(t_orig, t)
+            self.assertEqual(t_orig, t_json)
 
     def test_update_traces_by_type(self):
+        self.copy_figure()
+
         self.assert_update_traces(
             [0, 2, 9], {"visible": "legendonly"}, selector={"type": "scatter"}
         )
@@ -349,6 +358,8 @@ class TestSelectForEachUpdateTraces(TestCase):
         )
 
     def test_update_traces_by_grid_and_selector(self):
+        self.copy_figure()
+
         self.assert_update_traces(
             [4, 6], {"marker.size": 5}, selector={"marker.color": "green"}, col=2
         )